@@ -2,7 +2,8 @@
 Simple Amazon price scraper tutorial.
 
 This script:
-- Opens an Amazon search / category page in a headless Chrome browser
+- Downloads an Amazon search / category page and parses the static HTML,
+  falling back to a headless Chrome browser when the results need JavaScript
 - Extracts product title, URL, price and currency
 - Saves the results into amazon_prices.csv in the current folder
 
@@ -14,22 +15,116 @@ from __future__ import annotations
 
 import argparse
 import csv
+import json
+import math
 import re
 import sys
+import threading
 import time
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable, Iterator, List, Sequence
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+from urllib.request import url2pathname
 
+import httpx
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 
-@dataclass
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Fallback price pattern like "$19.99" anywhere in the product text
+_PRICE_RE = re.compile(r"([€$£])\s?(\d[\d,]*\.\d{2})")
+
+# Upper bound on pages fetched (or browsers running) at the same time
+_MAX_PAGE_WORKERS = 4
+
+# Removes thousands separators in a single pass, e.g. "1,299.00" -> "1299.00"
+_STRIP_COMMAS = str.maketrans("", "", ",")
+
+# Write the CSV in large chunks instead of many small writes
+_CSV_BUFFER_SIZE = 1 << 20
+
+_RESULT_SELECTOR = "div[data-component-type='s-search-result']"
+_NEXT_PAGE_SELECTOR = "a.s-pagination-next:not(.s-pagination-disabled)"
+
+# Collects the raw fields of every search result in one WebDriver round-trip.
+# Title and URL can have slightly different structures on different locales,
+# so we use selectors that match the current Amazon layout and fall back to
+# simpler ones if needed. Price parsing happens in Python (_parse_price_block).
+# Text is read with textContent, which (unlike innerText) needs no layout
+# pass and gives the same text an HTML parser would.
+_EXTRACT_PRODUCTS_JS = r"""
+return (function () {
+  function clean(el) {
+    return el.textContent.replace(/\s+/g, " ").trim();
+  }
+  function text(node, selector) {
+    var el = node.querySelector(selector);
+    return el ? clean(el) : null;
+  }
+  var nodes = document.querySelectorAll(
+    "div[data-component-type='s-search-result']"
+  );
+  var results = [];
+  for (var i = 0; i < nodes.length; i++) {
+    var node = nodes[i];
+    var title = node.querySelector("h2 span") || node.querySelector("h2");
+    var link =
+      node.querySelector("a.a-link-normal.s-link-style") ||
+      node.querySelector("a.a-link-normal");
+    var price = node.querySelector("span.a-price");
+    var item = {
+      title: title ? clean(title) : null,
+      url: link ? link.href : null,
+      priceText: null,
+      whole: null,
+      fraction: null,
+      currency: null,
+      text: null
+    };
+    if (price) {
+      item.priceText = text(price, ".a-offscreen");
+      item.whole = text(price, ".a-price-whole");
+      item.fraction = text(price, ".a-price-fraction");
+      item.currency = text(price, ".a-price-symbol");
+      // The whole product text is only read for the regex fallback
+      if (!item.priceText && !(item.whole && item.fraction && item.currency)) {
+        item.text = clean(node);
+      }
+    }
+    results.push(item);
+  }
+  return JSON.stringify(results);
+})();
+"""
+
+
+def _parse_price_value(price: str) -> float:
+    """Numeric value of a price string, or NaN if it cannot be parsed."""
+    try:
+        return float(price)
+    except ValueError:
+        return math.nan
+
+
+@dataclass(slots=True, frozen=True)
 class Product:
     title: str
     url: str
@@ -37,6 +132,60 @@ class Product:
     currency: str
     page: int
     position: int
+    # Derived once at construction so filtering never re-lowercases titles or
+    # re-parses prices. Not part of the CSV output.
+    title_lower: str = field(init=False, repr=False, compare=False)
+    price_value: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "title_lower", self.title.lower())
+        object.__setattr__(self, "price_value", _parse_price_value(self.price))
+
+
+class ProductView(Sequence[Product]):
+    """A read-only sequence of products plus the columns used to filter them.
+
+    Supports len(), indexing, iteration and == against other sequences.
+    It is not a list: use ``view.products`` (or ``list(view)``) when you
+    need to sort, append or concatenate. The lowered titles and numeric
+    prices are collected once, so filter_products can be called many times
+    with different filters (e.g. in a notebook) without touching every
+    Product again.
+    """
+
+    __slots__ = ("products", "titles_lower", "prices")
+
+    def __init__(self, products: Iterable[Product] = ()) -> None:
+        self.products: List[Product] = list(products)
+        self.titles_lower: List[str] = [p.title_lower for p in self.products]
+        self.prices: List[float] = [p.price_value for p in self.products]
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def __getitem__(self, index):
+        return self.products[index]
+
+    def __iter__(self) -> Iterator[Product]:
+        return iter(self.products)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ProductView):
+            return self.products == other.products
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return self.products == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ProductView({self.products!r})"
+
+    def _select(self, indices: List[int]) -> ProductView:
+        """New view over the given rows, reusing the precomputed columns."""
+        view = ProductView()
+        view.products = [self.products[i] for i in indices]
+        view.titles_lower = [self.titles_lower[i] for i in indices]
+        view.prices = [self.prices[i] for i in indices]
+        return view
 
 
 def _create_driver() -> webdriver.Chrome:
@@ -52,10 +201,19 @@ def _create_driver() -> webdriver.Chrome:
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument(
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
+    chrome_options.add_argument(f"--user-agent={_USER_AGENT}")
+
+    # We only read text from the page, so skip downloading images, CSS and
+    # fonts, and start scraping as soon as the DOM is ready.
+    chrome_options.page_load_strategy = "eager"
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        },
     )
 
     # Let Selenium Manager handle the driver binary automatically
@@ -63,121 +221,101 @@ def _create_driver() -> webdriver.Chrome:
     return driver
 
 
-def _parse_price_block(product_element) -> tuple[str | None, str | None]:
-    """Extract price and currency from one product container.
+def _parse_price_block(
+    offscreen_text: str,
+    whole: str = "",
+    fraction: str = "",
+    symbol: str = "",
+    full_text: str = "",
+) -> tuple[str | None, str | None]:
+    """Extract price and currency from the raw text of one product container.
 
-    We first try to parse from the dedicated price container (current price),
-    and only if that fails fall back to a text-based regex.
+    The span texts are expected to be trimmed already by the extractors.
+    We first try the fully formatted "a-offscreen" price, then the
+    whole + fraction structure, and only if both fail fall back to a
+    text-based regex over the whole product text.
     """
-    try:
-        price_container = product_element.find_element(
-            By.XPATH, ".//span[contains(@class, 'a-price')]"
-        )
-    except NoSuchElementException:
-        return None, None
-
-    # Many Amazon layouts include a fully formatted price in an "a-offscreen" span.
-    try:
-        offscreen_text = price_container.find_element(
-            By.CLASS_NAME, "a-offscreen"
-        ).text.strip()
-    except NoSuchElementException:
-        offscreen_text = ""
-
     if offscreen_text:
         # Example: "$19.99" or "€19,99"
         currency_char = offscreen_text[0]
-        numeric_part = offscreen_text[1:].strip().replace(",", "")
+        numeric_part = offscreen_text[1:].strip().translate(_STRIP_COMMAS)
         return numeric_part, currency_char
 
     # Fallback to whole + fraction structure
-    try:
-        whole = price_container.find_element(
-            By.CLASS_NAME, "a-price-whole"
-        ).text.replace(",", "").strip()
-        fraction = price_container.find_element(
-            By.CLASS_NAME, "a-price-fraction"
-        ).text.strip()
-        price_value = f"{whole}.{fraction}"
-    except NoSuchElementException:
-        # If either part is missing, treat price as unavailable
-        return None, None
-
-    try:
-        currency = price_container.find_element(
-            By.CLASS_NAME, "a-price-symbol"
-        ).text.strip()
-    except NoSuchElementException:
-        currency = ""
-
-    if price_value and currency:
-        return price_value, currency
+    if whole and fraction and symbol:
+        return f"{whole.translate(_STRIP_COMMAS)}.{fraction}", symbol
 
     # Final fallback: look for a pattern like "$19.99" anywhere in the product text
-    text = product_element.text
-    match = re.search(r"([€$£])\s?(\d[\d,]*\.\d{2})", text)
+    match = _PRICE_RE.search(full_text)
     if match:
         currency_char, numeric = match.groups()
-        numeric = numeric.replace(",", "")
-        return numeric, currency_char
+        return numeric.translate(_STRIP_COMMAS), currency_char
 
     return None, None
 
 
-def _wait_for_product_elements(driver: webdriver.Chrome, timeout: int = 10) -> None:
-    """Wait until at least one product result element is present on the page."""
+def _wait_for_product_elements(
+    driver: webdriver.Chrome, timeout: int = 10
+) -> List[dict] | None:
+    """Wait until at least one product result element is present on the page.
+
+    The extraction script doubles as the wait condition: polls before the
+    results appear return an empty list, and the first successful poll
+    already carries the raw fields of every product, so the page does not
+    have to be queried again. Returns None on timeout.
+    """
     try:
-        WebDriverWait(driver, timeout).until(
-            EC.presence_of_all_elements_located(
-                (By.XPATH, "//div[@data-component-type='s-search-result']")
-            )
+        return WebDriverWait(driver, timeout).until(
+            lambda d: json.loads(d.execute_script(_EXTRACT_PRODUCTS_JS)) or False
         )
     except TimeoutException:
         print(
             "[WARN] Timed out waiting for product elements. "
             "Continuing with whatever is currently loaded."
         )
+        return None
 
 
 def _scrape_products_on_current_page(
     driver: webdriver.Chrome,
     page_number: int,
+    raw_products: List[dict] | None = None,
 ) -> List[Product]:
-    """Scrape all products with prices on the currently loaded page."""
-    product_elements = driver.find_elements(
-        By.XPATH, "//div[@data-component-type='s-search-result']"
-    )
-    print(f"[INFO] Found {len(product_elements)} product elements on the page")
+    """Scrape all products with prices on the currently loaded page.
+
+    Every product field is collected in-page by a single ``execute_script``
+    call, instead of several WebDriver round-trips per product. Pass the
+    result of _wait_for_product_elements as ``raw_products`` to skip even
+    that call.
+    """
+    if raw_products is None:
+        raw_products = json.loads(driver.execute_script(_EXTRACT_PRODUCTS_JS))
+    return _build_products(raw_products, page_number)
+
+
+def _build_products(raw_products: List[dict], page_number: int) -> List[Product]:
+    """Turn raw product fields (from the browser or static HTML) into products."""
+    print(f"[INFO] Found {len(raw_products)} product elements on the page")
 
     products: List[Product] = []
     skipped_due_to_errors = 0
 
-    for index, element in enumerate(product_elements, start=1):
-        # Title and URL can have slightly different structures on different locales.
-        # We use CSS selectors that match the current Amazon layout and fall back
-        # to simpler ones if needed.
+    for index, raw in enumerate(raw_products, start=1):
         try:
-            try:
-                # Typical desktop search result: <a class="... s-link-style ..."><h2><span>Title</span></h2></a>
-                title_element = element.find_element(By.CSS_SELECTOR, "h2 span")
-            except NoSuchElementException:
-                title_element = element.find_element(By.CSS_SELECTOR, "h2")
-
-            try:
-                link_element = element.find_element(
-                    By.CSS_SELECTOR, "a.a-link-normal.s-link-style"
-                )
-            except NoSuchElementException:
-                link_element = element.find_element(By.CSS_SELECTOR, "a.a-link-normal")
-
-            title = title_element.text.strip()
-            product_url = link_element.get_attribute("href")
+            title = (raw["title"] or "").strip()
+            product_url = raw["url"]
 
             if not title or not product_url:
                 continue
 
             # Price and currency
-            price, currency = _parse_price_block(element)
+            price, currency = _parse_price_block(
+                raw["priceText"] or "",
+                whole=raw["whole"] or "",
+                fraction=raw["fraction"] or "",
+                symbol=raw["currency"] or "",
+                full_text=raw["text"] or "",
+            )
             if not price:
                 # Skip products without visible price (e.g. unavailable)
                 continue
@@ -204,136 +342,498 @@ def _scrape_products_on_current_page(
     return products
 
 
-def _go_to_next_page(driver: webdriver.Chrome) -> bool:
-    """Click the 'Next' pagination button if it exists and is enabled."""
+def _fetch_static_html(url: str) -> str:
+    """Return the raw HTML of a page without starting a browser."""
+    parsed = urlparse(url)
+    if parsed.scheme == "file":
+        return Path(url2pathname(parsed.path)).read_text(encoding="utf-8")
+
+    response = httpx.get(
+        url,
+        headers={"User-Agent": _USER_AGENT, "Accept-Language": "en-US,en;q=0.9"},
+        follow_redirects=True,
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.text
+
+
+def _clean_text(node) -> str:
+    """Text of ``node`` with whitespace collapsed, like clean() in the JS."""
+    return " ".join(node.text().split())
+
+
+def _node_text(node, selector: str) -> str | None:
+    """Text of the first element under ``node`` matching ``selector``."""
+    element = node.css_first(selector)
+    return _clean_text(element) if element is not None else None
+
+
+def _extract_static_products(tree: LexborHTMLParser, base_url: str) -> List[dict]:
+    """Collect raw product fields from parsed HTML.
+
+    Mirrors _EXTRACT_PRODUCTS_JS so both paths feed _build_products the
+    same structure.
+    """
+    raw_products: List[dict] = []
+    for node in tree.css(_RESULT_SELECTOR):
+        title = node.css_first("h2 span") or node.css_first("h2")
+        link = node.css_first("a.a-link-normal.s-link-style") or node.css_first(
+            "a.a-link-normal"
+        )
+        href = link.attributes.get("href") if link is not None else None
+        price = node.css_first("span.a-price")
+        raw = {
+            "title": _clean_text(title) if title is not None else None,
+            "url": urljoin(base_url, href) if href else None,
+            "priceText": None,
+            "whole": None,
+            "fraction": None,
+            "currency": None,
+            "text": None,
+        }
+        if price is not None:
+            raw["priceText"] = _node_text(price, ".a-offscreen")
+            raw["whole"] = _node_text(price, ".a-price-whole")
+            raw["fraction"] = _node_text(price, ".a-price-fraction")
+            raw["currency"] = _node_text(price, ".a-price-symbol")
+            # The whole product text is only read for the regex fallback
+            if not raw["priceText"] and not (
+                raw["whole"] and raw["fraction"] and raw["currency"]
+            ):
+                raw["text"] = " ".join(node.text(separator=" ").split())
+        raw_products.append(raw)
+    return raw_products
+
+
+def _page_urls(base_url: str, page_count: int) -> List[str]:
+    """Build the URLs of ``page_count`` result pages via the ``page`` parameter.
+
+    Numbering starts from the page already in ``base_url`` (1 if it has none),
+    so the first URL is always the page the user asked for.
+    """
+    parsed = urlparse(base_url)
+    query = parse_qsl(parsed.query, keep_blank_values=True)
+    start_page = 1
+    for key, value in query:
+        if key == "page" and value.isdigit() and int(value) > 0:
+            start_page = int(value)
+
+    query = [(key, value) for key, value in query if key != "page"]
+    return [
+        urlunparse(parsed._replace(query=urlencode(query + [("page", str(number))])))
+        for number in range(start_page, start_page + page_count)
+    ]
+
+
+def _fetch_page_html(url: str) -> str | None:
+    """Like _fetch_static_html, but returns None if the download fails."""
     try:
-        next_button = driver.find_element(
-            By.XPATH,
-            "//a[contains(@class, 's-pagination-next') and not(contains(@class, 's-pagination-disabled'))]",
+        return _fetch_static_html(url)
+    except httpx.HTTPError as exc:
+        print(f"[WARN] Failed to download {url}: {exc}", file=sys.stderr)
+        return None
+
+
+def _can_rewrite_page_urls(url: str) -> bool:
+    """Only real web pages understand the ``page`` query parameter."""
+    return urlparse(url).scheme in ("http", "https")
+
+
+def _iter_static_pages(
+    url: str,
+    tree: LexborHTMLParser,
+    max_pages: int,
+) -> Iterator[List[Product]]:
+    """Yield the products of each page parsed from static HTML.
+
+    Later pages are downloaded in parallel when their URLs can be built
+    directly, otherwise we follow the 'Next' link in the HTML one by one.
+    """
+    if max_pages > 1 and _can_rewrite_page_urls(url):
+        yield _build_products(_extract_static_products(tree, url), page_number=1)
+
+        page_urls = _page_urls(url, max_pages)[1:]
+        print(f"[INFO] Fetching pages 2-{max_pages} in parallel...")
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(page_urls), _MAX_PAGE_WORKERS)
         )
+        try:
+            pages_html = executor.map(_fetch_page_html, page_urls)
+            for page_number, (page_url, html) in enumerate(
+                zip(page_urls, pages_html), start=2
+            ):
+                if html is None:
+                    print(f"[INFO] Stopping pagination at page {page_number}.")
+                    return
+                raw_products = _extract_static_products(
+                    LexborHTMLParser(html), page_url
+                )
+                yield _build_products(raw_products, page_number=page_number)
+        finally:
+            executor.shutdown(cancel_futures=True)
+        return
+
+    current_page = 1
+    while True:
+        raw_products = _extract_static_products(tree, url)
+        yield _build_products(raw_products, page_number=current_page)
+
+        if current_page >= max_pages:
+            return
+
+        next_link = tree.css_first(_NEXT_PAGE_SELECTOR)
+        href = next_link.attributes.get("href") if next_link is not None else None
+        if not href:
+            print("[INFO] No next page link found; stopping pagination.")
+            return
+
+        current_page += 1
+        print(f"[INFO] Moving to page {current_page}...")
+        url = urljoin(url, href)
+        html = _fetch_page_html(url)
+        if html is None:
+            print(f"[INFO] Stopping pagination at page {current_page}.")
+            return
+        tree = LexborHTMLParser(html)
+
+
+def _go_to_next_page(driver: webdriver.Chrome) -> bool:
+    """Open the page behind the 'Next' pagination button if it is enabled.
+
+    We navigate straight to the button's link rather than clicking it, so
+    each page is a plain page load. Buttons without a link are clicked.
+    """
+    try:
+        next_button = driver.find_element(By.CSS_SELECTOR, _NEXT_PAGE_SELECTOR)
     except NoSuchElementException:
         print("[INFO] No next page button found; stopping pagination.")
         return False
 
+    href = next_button.get_attribute("href")
+    if href:
+        driver.get(href)
+        return True
+
     try:
         driver.execute_script("arguments[0].click();", next_button)
     except Exception:
         next_button.click()
 
-    # Wait for the next page to load some results
-    _wait_for_product_elements(driver)
     return True
 
 
-def _apply_filters(
-    products: List[Product],
+def _build_product_filter(
     min_price: float | None,
     max_price: float | None,
     title_contains: str | None,
+) -> Callable[[float, str], bool] | None:
+    """Build a predicate that only tests the filters that are actually set.
+
+    The predicate takes a product's ``price_value`` and ``title_lower``, so
+    it works both on Product objects and on ProductView columns. Returns
+    None when no filter is set. Products without a numeric price (NaN) never
+    pass an active filter.
+    """
+    has_price_range = min_price is not None or max_price is not None
+    if not has_price_range and not title_contains:
+        return None
+
+    low = min_price if min_price is not None else -math.inf
+    high = max_price if max_price is not None else math.inf
+    query = title_contains.lower() if title_contains else ""
+
+    if has_price_range and query:
+        return lambda price, title: low <= price <= high and query in title
+    if has_price_range:
+        return lambda price, title: low <= price <= high
+    return lambda price, title: query in title and not math.isnan(price)
+
+
+def _apply_filters(
+    products: List[Product],
+    product_filter: Callable[[float, str], bool] | None,
 ) -> List[Product]:
-    """Filter products by numeric price range and optional title substring."""
-    if min_price is None and max_price is None and not title_contains:
+    """Keep the products accepted by a predicate from _build_product_filter."""
+    if product_filter is None:
         return products
+    return [p for p in products if product_filter(p.price_value, p.title_lower)]
 
-    filtered: List[Product] = []
-    query = title_contains.lower() if title_contains else None
 
-    for product in products:
-        # Title filter
-        if query and query not in product.title.lower():
-            continue
+def filter_products(
+    view: ProductView,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    title_contains: str | None = None,
+) -> ProductView:
+    """Filter already scraped products without scraping again.
 
-        # Price range filter
-        try:
-            value = float(product.price)
-        except ValueError:
-            continue
+    Works on the view's precomputed columns and returns a new view, so
+    results can be filtered further.
+    """
+    product_filter = _build_product_filter(min_price, max_price, title_contains)
+    if product_filter is None:
+        return view
+
+    indices = [
+        i
+        for i, (price, title) in enumerate(zip(view.prices, view.titles_lower))
+        if product_filter(price, title)
+    ]
+    return view._select(indices)
 
-        if min_price is not None and value < min_price:
-            continue
-        if max_price is not None and value > max_price:
-            continue
 
-        filtered.append(product)
+def _save_debug_html(html: str) -> None:
+    """Dump the first loaded page to an HTML file for debugging (``--debug``).
 
-    return filtered
+    This can help you inspect the structure if selectors ever stop working.
+    """
+    try:
+        debug_path = Path("debug_last_page.html")
+        debug_path.write_text(html, encoding="utf-8")
+        print(f"[INFO] Saved a copy of the first page HTML to {debug_path.name}")
+    except Exception:
+        print("[WARN] Failed to save debug HTML copy.", file=sys.stderr)
 
 
-def scrape_amazon_prices(
+def _iter_dynamic_pages_parallel(
+    page_urls: List[str],
+    debug: bool = False,
+) -> Iterator[List[Product]]:
+    """Yield the products of each page, rendered by a small pool of browsers.
+
+    Every worker thread starts its own Chrome the first time it is used and
+    keeps it for the following pages; all of them are quit at the end.
+    """
+    local = threading.local()
+    drivers: List[webdriver.Chrome] = []
+    drivers_lock = threading.Lock()
+
+    def scrape_page(page_number: int, page_url: str) -> List[Product] | None:
+        driver = getattr(local, "driver", None)
+        if driver is None:
+            driver = local.driver = _create_driver()
+            with drivers_lock:
+                drivers.append(driver)
+
+        try:
+            driver.get(page_url)
+        except WebDriverException as exc:
+            print(f"[WARN] Failed to load {page_url}: {exc.msg}", file=sys.stderr)
+            return None
+        raw_products = _wait_for_product_elements(driver)
+        if debug and page_number == 1:
+            _save_debug_html(driver.page_source)
+        return _scrape_products_on_current_page(
+            driver, page_number=page_number, raw_products=raw_products
+        )
+
+    print(f"[INFO] Rendering pages 1-{len(page_urls)} in parallel...")
+    executor = ThreadPoolExecutor(max_workers=min(len(page_urls), _MAX_PAGE_WORKERS))
+    try:
+        pages = executor.map(scrape_page, range(1, len(page_urls) + 1), page_urls)
+        for page_number, page_products in enumerate(pages, start=1):
+            if page_products is None:
+                print(f"[INFO] Stopping pagination at page {page_number}.")
+                return
+            yield page_products
+    finally:
+        executor.shutdown(cancel_futures=True)
+        for driver in drivers:
+            driver.quit()
+
+
+def _iter_dynamic_pages(
     url: str,
-    max_pages: int = 1,
-    max_products: int | None = None,
-    min_price: float | None = None,
-    max_price: float | None = None,
-    title_contains: str | None = None,
-) -> List[Product]:
-    """Scrape one or more Amazon pages and return a list of products."""
-    print("[INFO] Opening Amazon page...")
-    driver = _create_driver()
+    max_pages: int,
+    driver: webdriver.Chrome | None = None,
+    debug: bool = False,
+) -> Iterator[List[Product]]:
+    """Yield the products of each page rendered in headless Chrome.
+
+    A ``driver`` passed in by the caller is reused and left open; otherwise
+    we start our own browser(s) and quit them when done.
+    """
+    if driver is None and max_pages > 1 and _can_rewrite_page_urls(url):
+        yield from _iter_dynamic_pages_parallel(_page_urls(url, max_pages), debug)
+        return
+
+    # Pages we cannot address by URL are walked with the 'Next' button instead
+    owns_driver = driver is None
+    if owns_driver:
+        driver = _create_driver()
 
     try:
         driver.get(url)
         # Wait for content to load
-        _wait_for_product_elements(driver)
+        raw_products = _wait_for_product_elements(driver)
+        if debug:
+            _save_debug_html(driver.page_source)
 
-        # Optional: dump the first loaded page to an HTML file for debugging.
-        # This can help you inspect the structure if selectors ever stop working.
-        try:
-            debug_path = Path("debug_last_page.html")
-            debug_path.write_text(driver.page_source, encoding="utf-8")
-            print(f"[INFO] Saved a copy of the first page HTML to {debug_path.name}")
-        except Exception:
-            print("[WARN] Failed to save debug HTML copy.", file=sys.stderr)
-
-        all_products: List[Product] = []
         current_page = 1
 
         while True:
-            page_products = _scrape_products_on_current_page(
-                driver,
-                page_number=current_page,
+            yield _scrape_products_on_current_page(
+                driver, page_number=current_page, raw_products=raw_products
             )
-            page_products = _apply_filters(
-                page_products,
-                min_price=min_price,
-                max_price=max_price,
-                title_contains=title_contains,
-            )
-            all_products.extend(page_products)
-
-            if max_products is not None and len(all_products) >= max_products:
-                all_products = all_products[:max_products]
-                break
 
             if current_page >= max_pages:
-                break
+                return
 
             print(f"[INFO] Moving to page {current_page + 1}...")
             if not _go_to_next_page(driver):
-                break
+                return
 
+            # Wait for the next page to load some results
+            raw_products = _wait_for_product_elements(driver)
             current_page += 1
+    finally:
+        if owns_driver:
+            driver.quit()
+
+
+def iter_amazon_products(
+    url: str,
+    max_pages: int = 1,
+    max_products: int | None = None,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    title_contains: str | None = None,
+    dynamic: bool = False,
+    driver: webdriver.Chrome | None = None,
+    debug: bool = False,
+) -> Iterator[Product]:
+    """Scrape one or more Amazon pages, yielding products page by page.
+
+    Pages are parsed from their static HTML unless ``dynamic`` is set or a
+    ``driver`` is given. An http(s) page whose download fails, or whose
+    static HTML has no search results (for example because they are rendered
+    by JavaScript), is retried in headless Chrome. A given ``driver`` is
+    reused and not quit, so one browser can serve many calls. With ``debug``
+    the first page's HTML is saved to debug_last_page.html.
+    """
+    print("[INFO] Opening Amazon page...")
+    pages: Iterator[List[Product]] | None = None
 
-        print(f"[INFO] Total products collected after pagination: {len(all_products)}")
-        return all_products
+    if not dynamic and driver is None:
+        try:
+            html = _fetch_static_html(url)
+        except httpx.HTTPError as exc:
+            # Amazon often answers plain HTTP clients with e.g. 503
+            print(
+                f"[INFO] Could not download the static HTML ({exc}); "
+                "rendering the page in headless Chrome instead."
+            )
+            html = None
+
+        if html is not None:
+            if debug:
+                _save_debug_html(html)
+            tree = LexborHTMLParser(html)
+            if urlparse(url).scheme == "file" or tree.css_first(_RESULT_SELECTOR):
+                pages = _iter_static_pages(url, tree, max_pages)
+            else:
+                print(
+                    "[INFO] No product results in the static HTML; "
+                    "rendering the page in headless Chrome instead."
+                )
+
+    if pages is None:
+        pages = _iter_dynamic_pages(url, max_pages, driver=driver, debug=debug)
+
+    product_filter = _build_product_filter(min_price, max_price, title_contains)
+    products = (
+        product
+        for page_products in pages
+        for product in _apply_filters(page_products, product_filter)
+    )
+
+    try:
+        # islice stops right after the last wanted product. On the sequential
+        # Next-link paths no further page is requested; the parallel paths
+        # have already submitted every page, and closing them only cancels
+        # pages not yet started (those in flight are still waited for).
+        limit = max(max_products, 0) if max_products is not None else None
+        yield from islice(products, limit)
     finally:
-        driver.quit()
+        # Stops the page iterator early (and quits Chrome, if one was started)
+        pages.close()
+
+
+def scrape_amazon_prices(
+    url: str,
+    max_pages: int = 1,
+    max_products: int | None = None,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    title_contains: str | None = None,
+    dynamic: bool = False,
+    driver: webdriver.Chrome | None = None,
+    debug: bool = False,
+) -> ProductView:
+    """Scrape one or more Amazon pages and return the products.
+
+    See iter_amazon_products for the meaning of the arguments. The result
+    can be indexed and iterated like a list, and passed to filter_products
+    to try other filters on the same products.
+    """
+    all_products = ProductView(
+        iter_amazon_products(
+            url,
+            max_pages=max_pages,
+            max_products=max_products,
+            min_price=min_price,
+            max_price=max_price,
+            title_contains=title_contains,
+            dynamic=dynamic,
+            driver=driver,
+            debug=debug,
+        )
+    )
+    print(f"[INFO] Total products collected after pagination: {len(all_products)}")
+    return all_products
+
 
+def save_products_to_csv(products: Iterable[Product], output_path: Path) -> None:
+    """Save products to a CSV file, one row per product as it arrives.
 
-def save_products_to_csv(products: List[Product], output_path: Path) -> None:
-    """Save product list to a CSV file."""
-    if not products:
+    ``products`` may be a lazy iterator such as iter_amazon_products, so the
+    full result list never has to be held in memory. Rows go through a
+    large write buffer, so the file on disk fills in big chunks rather than
+    page by page.
+    """
+    products = iter(products)
+    first_product = next(products, None)
+    if first_product is None:
         print("[INFO] No products to save; CSV will not be created.")
         return
 
     fieldnames = ["title", "url", "price", "currency", "page", "position"]
-    with output_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for product in products:
-            writer.writerow(asdict(product))
+    row_of = attrgetter(*fieldnames)
+    saved = 0
+
+    def rows() -> Iterator[tuple]:
+        nonlocal saved
+        for product in chain((first_product,), products):
+            saved += 1
+            yield row_of(product)
+
+    with output_path.open(
+        "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE
+    ) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows())
+
+    print(f"[INFO] Saved {saved} products to {output_path.name}")
+
 
-    print(f"[INFO] Saved {len(products)} products to {output_path.name}")
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts that may be zero but not negative."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -358,7 +858,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--max-products",
-        type=int,
+        type=_non_negative_int,
         default=None,
         help="Maximum number of products to collect in total (default: no limit).",
     )
@@ -380,18 +880,30 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Only keep products whose title contains this text (case-insensitive).",
     )
+    parser.add_argument(
+        "--dynamic",
+        action="store_true",
+        help="Always render pages in headless Chrome instead of parsing static HTML.",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Save the first loaded page's HTML to debug_last_page.html.",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
-    products = scrape_amazon_prices(
+    products = iter_amazon_products(
         args.url,
         max_pages=args.max_pages,
         max_products=args.max_products,
         min_price=args.min_price,
         max_price=args.max_price,
         title_contains=args.title_contains,
+        dynamic=args.dynamic,
+        debug=args.debug,
     )
     output_path = Path(args.output).resolve()
     save_products_to_csv(products, output_path)
@@ -0,0 +1,18 @@
+from typing import Iterator
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from main import _create_driver
+
+
+@pytest.fixture(scope="session")
+def shared_driver() -> Iterator:
+    """One headless Chrome shared by every browser-based test."""
+    try:
+        driver = _create_driver()
+    except WebDriverException as exc:
+        pytest.skip(f"Headless Chrome is not available: {exc.msg}")
+
+    yield driver
+    driver.quit()
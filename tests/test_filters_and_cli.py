@@ -3,7 +3,15 @@ import subprocess
 import sys
 from pathlib import Path
 
-from main import Product, scrape_amazon_prices
+import pytest
+
+from main import (
+    Product,
+    _page_urls,
+    filter_products,
+    parse_args,
+    scrape_amazon_prices,
+)
 
 
 def _sample_file_url() -> str:
@@ -77,3 +85,50 @@ def test_max_products_limit(tmp_path: Path) -> None:
     assert row["page"] == "1"
     assert row["position"] == "1"
 
+
+def test_page_urls_set_page_parameter() -> None:
+    """_page_urls should add the page parameter, starting from the given page."""
+    assert _page_urls("https://www.amazon.com/s?k=wireless+mouse", 2) == [
+        "https://www.amazon.com/s?k=wireless+mouse&page=1",
+        "https://www.amazon.com/s?k=wireless+mouse&page=2",
+    ]
+    assert _page_urls("https://www.amazon.com/s?k=wireless+mouse&page=7", 3) == [
+        "https://www.amazon.com/s?k=wireless+mouse&page=7",
+        "https://www.amazon.com/s?k=wireless+mouse&page=8",
+        "https://www.amazon.com/s?k=wireless+mouse&page=9",
+    ]
+
+
+def test_filter_products_reuses_scraped_view() -> None:
+    """filter_products should re-filter scraped products without scraping again."""
+    products = scrape_amazon_prices(_sample_file_url())
+
+    assert len(products) == 2
+    assert [p.title for p in filter_products(products, max_price=20.0)] == [
+        "Sample Product 1"
+    ]
+    assert [p.title for p in filter_products(products, title_contains="PRODUCT 2")] == [
+        "Sample Product 2"
+    ]
+
+    cheap = filter_products(products, max_price=50.0)
+    assert len(filter_products(cheap, title_contains="product")) == 2
+    assert len(filter_products(cheap, min_price=100.0)) == 0
+
+
+def test_scraped_view_compares_like_a_list() -> None:
+    """The scraped view should compare equal to a list of the same products."""
+    products = scrape_amazon_prices(_sample_file_url())
+
+    assert products == list(products)
+    assert products == scrape_amazon_prices(_sample_file_url())
+    assert filter_products(products, min_price=20.0) == [products[1]]
+    assert products != products.products[:1]
+
+
+def test_negative_max_products_rejected() -> None:
+    """CLI: a negative --max-products should be a usage error, not a crash."""
+    with pytest.raises(SystemExit):
+        parse_args(["--url", _sample_file_url(), "--max-products", "-1"])
+
+    assert scrape_amazon_prices(_sample_file_url(), max_products=-1) == []
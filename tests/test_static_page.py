@@ -1,5 +1,10 @@
+import json
 from pathlib import Path
+from urllib.parse import parse_qsl, urlparse
 
+import httpx
+
+import main
 from main import Product, scrape_amazon_prices
 
 
@@ -31,3 +36,192 @@ def test_scrape_sample_static_page() -> None:
     assert second.page == 1
     assert second.position == 2
 
+
+def test_scrape_sample_page_in_browser(shared_driver) -> None:
+    """The headless Chrome path should parse the same products."""
+    sample_file = Path(__file__).parent / "sample_page.html"
+    file_url = sample_file.resolve().as_uri()
+
+    products = scrape_amazon_prices(file_url, driver=shared_driver)
+
+    assert [(p.title, p.url, p.price, p.currency, p.position) for p in products] == [
+        ("Sample Product 1", "https://www.example.com/product-1", "19.99", "$", 1),
+        ("Sample Product 2", "https://www.example.com/product-2", "42.50", "$", 2),
+    ]
+
+
+class _FakeDriver:
+    """Minimal stand-in for a WebDriver that serves fixed product fields."""
+
+    def __init__(self, raw_products: list) -> None:
+        self.raw_products = raw_products
+        self.visited = []
+        self.quit_calls = 0
+
+    def get(self, url: str) -> None:
+        self.visited.append(url)
+
+    def execute_script(self, script: str) -> str:
+        return json.dumps(self.raw_products)
+
+    def quit(self) -> None:
+        self.quit_calls += 1
+
+
+def test_given_driver_is_reused_and_not_quit() -> None:
+    """A given driver should serve every call and be left open."""
+    raw = {
+        "title": "Browser Product",
+        "url": "https://www.example.com/b",
+        "priceText": "$7.25",
+        "whole": "7",
+        "fraction": "25",
+        "currency": "$",
+        "text": None,
+    }
+    driver = _FakeDriver([raw])
+    url = "https://www.amazon.com/s?k=mouse"
+
+    first = scrape_amazon_prices(url, driver=driver)
+    second = scrape_amazon_prices(url, driver=driver)
+
+    assert driver.visited == [url, url]
+    assert driver.quit_calls == 0
+    for products in (first, second):
+        assert [(p.title, p.price, p.currency) for p in products] == [
+            ("Browser Product", "7.25", "$")
+        ]
+
+
+def test_static_fetch_error_falls_back_to_browser(monkeypatch) -> None:
+    """An HTTP error on the static download should retry the page in Chrome."""
+    url = "https://www.amazon.com/s?k=mouse"
+
+    def fake_get(request_url: str, **kwargs) -> httpx.Response:
+        return httpx.Response(503, request=httpx.Request("GET", request_url))
+
+    rendered = []
+
+    def fake_dynamic_pages(page_url: str, max_pages: int, **kwargs):
+        rendered.append(page_url)
+        yield [Product("Rendered", "https://www.example.com/r", "5.00", "$", 1, 1)]
+
+    monkeypatch.setattr(main.httpx, "get", fake_get)
+    monkeypatch.setattr(main, "_iter_dynamic_pages", fake_dynamic_pages)
+
+    products = scrape_amazon_prices(url)
+
+    assert rendered == [url]
+    assert [p.title for p in products] == ["Rendered"]
+
+
+def _fake_pages_get(html_by_page: dict, requested: list):
+    """Fake httpx.get serving sample_page.html for the pages in html_by_page."""
+
+    def fake_get(request_url: str, **kwargs) -> httpx.Response:
+        requested.append(request_url)
+        page = dict(parse_qsl(urlparse(request_url).query))["page"]
+        request = httpx.Request("GET", request_url)
+        if page not in html_by_page:
+            return httpx.Response(503, request=request)
+        return httpx.Response(200, text=html_by_page[page], request=request)
+
+    return fake_get
+
+
+def test_static_pages_fetched_from_starting_page(monkeypatch) -> None:
+    """Parallel pagination should continue from the page in the URL."""
+    sample_html = (Path(__file__).parent / "sample_page.html").read_text(
+        encoding="utf-8"
+    )
+    html_by_page = {
+        "5": sample_html,
+        "6": sample_html.replace("Sample Product", "Page 6 Product"),
+        "7": sample_html.replace("Sample Product", "Page 7 Product"),
+    }
+    requested = []
+    monkeypatch.setattr(main.httpx, "get", _fake_pages_get(html_by_page, requested))
+
+    products = scrape_amazon_prices(
+        "https://www.amazon.com/s?k=mouse&page=5", max_pages=3
+    )
+
+    assert sorted(requested) == [
+        "https://www.amazon.com/s?k=mouse&page=5",
+        "https://www.amazon.com/s?k=mouse&page=6",
+        "https://www.amazon.com/s?k=mouse&page=7",
+    ]
+    assert [(p.title, p.page) for p in products] == [
+        ("Sample Product 1", 1),
+        ("Sample Product 2", 1),
+        ("Page 6 Product 1", 2),
+        ("Page 6 Product 2", 2),
+        ("Page 7 Product 1", 3),
+        ("Page 7 Product 2", 3),
+    ]
+
+
+def test_static_page_fetch_error_stops_pagination(monkeypatch) -> None:
+    """A failed download of a later page should end pagination, not the run."""
+    sample_html = (Path(__file__).parent / "sample_page.html").read_text(
+        encoding="utf-8"
+    )
+    requested = []
+    monkeypatch.setattr(
+        main.httpx, "get", _fake_pages_get({"1": sample_html}, requested)
+    )
+
+    products = scrape_amazon_prices(
+        "https://www.amazon.com/s?k=mouse&page=1", max_pages=3
+    )
+
+    assert [(p.title, p.page) for p in products] == [
+        ("Sample Product 1", 1),
+        ("Sample Product 2", 1),
+    ]
+
+
+def test_multiline_title_is_normalized(tmp_path: Path) -> None:
+    """Whitespace inside titles should collapse to single spaces, as in Chrome."""
+    page = tmp_path / "multiline.html"
+    page.write_text(
+        """
+        <div data-component-type="s-search-result">
+          <h2><a class="a-link-normal" href="https://www.example.com/m">
+            <span>Foo
+                  Bar</span>
+          </a></h2>
+          <span class="a-price"><span class="a-offscreen"> $3.50 </span></span>
+        </div>
+        """,
+        encoding="utf-8",
+    )
+
+    products = scrape_amazon_prices(page.resolve().as_uri())
+
+    assert [(p.title, p.price) for p in products] == [("Foo Bar", "3.50")]
+
+
+def test_regex_fallback_handles_multiline_price(tmp_path: Path) -> None:
+    """The text fallback should find a price split over several lines."""
+    page = tmp_path / "fallback.html"
+    page.write_text(
+        """
+        <div data-component-type="s-search-result">
+          <h2><a class="a-link-normal" href="https://www.example.com/f">
+            <span>Fallback Product</span>
+          </a></h2>
+          <span class="a-price"><span class="a-price-whole">19</span></span>
+          <div>Price:
+            $
+            19.99</div>
+        </div>
+        """,
+        encoding="utf-8",
+    )
+
+    products = scrape_amazon_prices(page.resolve().as_uri())
+
+    assert [(p.title, p.price, p.currency) for p in products] == [
+        ("Fallback Product", "19.99", "$")
+    ]